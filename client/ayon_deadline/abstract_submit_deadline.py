@@ -13,7 +13,6 @@ from copy import deepcopy
 from typing import Optional
 import clique
 
-import requests
 import pyblish.api
 
 from ayon_core.pipeline.publish import (
@@ -26,7 +25,11 @@ from ayon_core.pipeline.publish.lib import (
 )
 from ayon_core.pipeline.farm.tools import iter_expected_files
 from ayon_core.lib import is_in_tests
-from ayon_deadline.lib import PublishDeadlineJobInfo
+from ayon_deadline.lib import (
+    PublishDeadlineJobInfo,
+    get_session,
+    json_encode,
+)
 
 JSONDecodeError = getattr(json.decoder, "JSONDecodeError", ValueError)
 
@@ -43,13 +46,17 @@ def requests_post(*args, **kwargs):
         Disabling SSL certificate validation is defeating one line
         of defense SSL is providing, and it is not recommended.
 
+    Request is sent through shared session of the webservice so keep-alive
+    connection is reused across submissions.
+
     """
     auth = kwargs.get("auth")
     if auth:
         kwargs["auth"] = tuple(auth)  # explicit cast to tuple
     # add 10sec timeout before bailing out
     kwargs['timeout'] = 10
-    return requests.post(*args, **kwargs)
+    session = get_session(args[0] if args else kwargs["url"])
+    return session.post(*args, **kwargs)
 
 
 def requests_get(*args, **kwargs):
@@ -70,7 +77,8 @@ def requests_get(*args, **kwargs):
         kwargs["auth"] = tuple(auth)
     # add 10sec timeout before bailing out
     kwargs['timeout'] = 10
-    return requests.get(*args, **kwargs)
+    session = get_session(args[0] if args else kwargs["url"])
+    return session.get(*args, **kwargs)
 
 
 class AbstractSubmitDeadline(
@@ -354,7 +362,12 @@ class AbstractSubmitDeadline(
         """
         url = "{}/api/jobs".format(self._deadline_url)
         response = requests_post(
-            url, json=payload, auth=auth, verify=verify)
+            url,
+            data=json_encode(payload),
+            headers={"Content-Type": "application/json"},
+            auth=auth,
+            verify=verify
+        )
         if not response.ok:
             self.log.error("Submission failed!")
             self.log.error(response.status_code)
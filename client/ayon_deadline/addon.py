@@ -3,7 +3,6 @@ import subprocess
 import typing
 from typing import Optional, List, Dict, Any, Tuple
 
-import requests
 import ayon_api
 
 from ayon_core.addon import AYONAddon, IPluginPaths
@@ -14,11 +13,10 @@ from .constants import AYON_PLUGIN_VERSION
 from .lib import (
     DeadlineConnectionInfo,
     DeadlineServerInfo,
-    get_deadline_workers,
-    get_deadline_groups,
-    get_deadline_limit_groups,
-    get_deadline_pools,
+    get_deadline_info_bulk,
     DeadlineJobInfo,
+    get_session,
+    json_encode,
 )
 
 if typing.TYPE_CHECKING:
@@ -74,6 +72,7 @@ class DeadlineAddon(AYONAddon, IPluginPaths):
         self,
         server_name: str,
         local_settings: Optional[Dict[str, Any]] = None,
+        allow_stale: bool = False,
     ) -> DeadlineServerInfo:
         """Returns Deadline server info by name.
 
@@ -81,6 +80,8 @@ class DeadlineAddon(AYONAddon, IPluginPaths):
             server_name (str): Deadline Server name from Project Settings.
             local_settings (Optional[Dict[str, Any]]): Deadline local
                 settings.
+            allow_stale (bool): Return expired cached items right away and
+                refresh them in background.
 
         Returns:
             DeadlineServerInfo: Deadline server info.
@@ -91,16 +92,10 @@ class DeadlineAddon(AYONAddon, IPluginPaths):
             con_info = self.get_deadline_server_connection_info(
                 server_name, local_settings
             )
-            server_url, auth = con_info.url, con_info.auth
-            pools = get_deadline_pools(server_url, auth)
-            groups = get_deadline_groups(server_url, auth)
-            limit_groups = get_deadline_limit_groups(server_url, auth)
-            machines = get_deadline_workers(server_url, auth)
             server_info = DeadlineServerInfo(
-                pools=pools,
-                limit_groups=limit_groups,
-                groups=groups,
-                machines=machines
+                **get_deadline_info_bulk(
+                    con_info.url, con_info.auth, allow_stale=allow_stale
+                )
             )
             self._server_info_by_name[server_name] = server_info
 
@@ -127,8 +122,9 @@ class DeadlineAddon(AYONAddon, IPluginPaths):
         con_info = self.get_deadline_server_connection_info(
             server_name, local_settings
         )
-        response = requests.get(
-            f"{con_info.url}/api/jobs?JobID={job_id}",
+        url = f"{con_info.url}/api/jobs?JobID={job_id}"
+        response = get_session(url).get(
+            url,
             auth=con_info.auth,
             verify=con_info.verify
         )
@@ -172,9 +168,11 @@ class DeadlineAddon(AYONAddon, IPluginPaths):
         con_info = self.get_deadline_server_connection_info(
             server_name, local_settings
         )
-        response = requests.post(
-            f"{con_info.url}/api/jobs",
-            json=payload,
+        url = f"{con_info.url}/api/jobs"
+        response = get_session(url).post(
+            url,
+            data=json_encode(payload),
+            headers={"Content-Type": "application/json"},
             timeout=10,
             auth=con_info.auth,
             verify=con_info.verify
@@ -1,15 +1,31 @@
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, fields
 from functools import partial
+from urllib.parse import urlsplit
 import typing
 from typing import Optional, List, Tuple, Any, Dict, Iterable
 from enum import Enum
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ayon_core.lib import Logger
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 if typing.TYPE_CHECKING:
-    from typing import Union, Self
+    from dataclasses import Field
+    from typing import Union, Self, Callable, Set
+
+    FieldSerializer = Callable[[str, Any, Dict[str, Any]], None]
 
 
 # describes list of product typed used for plugin filtering for farm publishing
@@ -30,6 +46,28 @@ FARM_FAMILIES = [
 #     This variable is NOT USED anywhere in deadline addon.
 JOB_ENV_DATA_KEY: str = "farmJobEnv"
 
+_log = Logger.get_logger(__name__)
+
+# Timeout for Deadline webservice queries as (connect, read) in seconds
+DEADLINE_QUERY_TIMEOUT: Tuple[float, float] = (3.05, 30)
+
+# Sessions by webservice url so connections are reused between requests
+_SESSIONS: "Dict[str, requests.Session]" = {}
+_SESSIONS_LOCK = threading.Lock()
+
+# Cached query results by (endpoint, username) as (timestamp, items)
+_INFO_CACHE: "Dict[Tuple[str, Optional[str]], Tuple[float, List[str]]]" = {}
+# Lifetime of cached query results by item type in seconds
+_INFO_CACHE_TTL: Dict[str, float] = {
+    "pools": 30,
+    "groups": 60,
+    "limitgroups": 30,
+    "workers": 15,
+}
+# Cache keys of query results which are being refreshed in background
+_INFO_REFRESHING: "Set[Tuple[str, Optional[str]]]" = set()
+_INFO_REFRESHING_LOCK = threading.Lock()
+
 
 @dataclass
 class DeadlineConnectionInfo:
@@ -42,6 +80,9 @@ class DeadlineConnectionInfo:
 
 @dataclass
 class DeadlineServerInfo:
+    # Explicit slots, 'dataclass(slots=True)' requires Python 3.10
+    __slots__ = ("pools", "limit_groups", "groups", "machines")
+
     pools: List[str]
     limit_groups: List[str]
     groups: List[str]
@@ -61,24 +102,116 @@ class JobType(str, Enum):
     REMOTE = "remote"
 
     def get_job_env(self) -> Dict[str, str]:
-        return {
-            "AYON_PUBLISH_JOB": str(int(self == JobType.PUBLISH)),
-            "AYON_RENDER_JOB": str(int(self == JobType.RENDER)),
-            "AYON_REMOTE_PUBLISH": str(int(self == JobType.REMOTE)),
-        }
+        return dict(_JOB_ENV_BY_TYPE[self])
 
     @classmethod
     def get(
         cls, value: Any, default: Optional[Any] = None
     ) -> "JobType":
         try:
-            return cls(value)
-        except ValueError:
+            return _JOB_TYPE_BY_VALUE[value]
+        except (KeyError, TypeError):
             if default is None:
                 return cls.UNDEFINED
             return default
 
 
+def json_encode(data: Any) -> bytes:
+    """Encode data to UTF-8 JSON bytes, using 'orjson' when available.
+
+    Falls back to 'json' for data 'orjson' refuses to serialize, e.g.
+        dictionaries with non-string keys.
+
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            pass
+    return json.dumps(data).encode()
+
+
+def json_loads(data: "Union[str, bytes]") -> Any:
+    """Load JSON data, using 'orjson' when available."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Lookup used by 'JobType.get', members are equal to their string values
+_JOB_TYPE_BY_VALUE: Dict[str, JobType] = {
+    job_type.value: job_type
+    for job_type in JobType
+}
+# Prepared job environments returned by 'JobType.get_job_env'
+_JOB_ENV_BY_TYPE: Dict[JobType, Dict[str, str]] = {
+    job_type: {
+        "AYON_PUBLISH_JOB": str(int(job_type == JobType.PUBLISH)),
+        "AYON_RENDER_JOB": str(int(job_type == JobType.RENDER)),
+        "AYON_REMOTE_PUBLISH": str(int(job_type == JobType.REMOTE)),
+    }
+    for job_type in JobType
+}
+
+
+def get_session(url: str) -> requests.Session:
+    """Get shared session for Deadline webservice of the url.
+
+    Args:
+        url (str): Webservice url or url of its endpoint.
+
+    Returns:
+        requests.Session: Session with pooled keep-alive connections.
+
+    """
+    parts = urlsplit(url)
+    session_key = f"{parts.scheme}://{parts.netloc}"
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(session_key)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(total=2, backoff_factor=0.2),
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update({
+                "Accept": "application/json",
+                "Connection": "keep-alive",
+            })
+            _SESSIONS[session_key] = session
+    return session
+
+
+def close_sessions():
+    """Close all shared sessions used to query Deadline webservices."""
+    with _SESSIONS_LOCK:
+        for session in _SESSIONS.values():
+            session.close()
+        _SESSIONS.clear()
+
+
+def normalize_webservice_url(webservice_url: str) -> str:
+    """Strip whitespaces and trailing slashes from webservice url.
+
+    Urls from settings or instance data might contain both.
+
+    Args:
+        webservice_url (str): Deadline Webservice url.
+
+    Returns:
+        str: Normalized url.
+
+    """
+    return webservice_url.strip().rstrip("/")
+
+
+def _get_endpoint(webservice_url: str, api_path: str) -> str:
+    return f"{normalize_webservice_url(webservice_url)}/api/{api_path}"
+
+
 def get_deadline_pools(
     webservice_url: str,
     auth: Optional[Tuple[str, str]] = None,
@@ -99,7 +232,7 @@ def get_deadline_pools(
         RuntimeError: If deadline webservice is unreachable.
 
     """
-    endpoint = f"{webservice_url}/api/pools?NamesOnly=true"
+    endpoint = _get_endpoint(webservice_url, "pools?NamesOnly=true")
     return _get_deadline_info(endpoint, auth, log, "pools")
 
 
@@ -123,7 +256,7 @@ def get_deadline_groups(
         RuntimeError: If deadline webservice_url is unreachable.
 
     """
-    endpoint = f"{webservice_url}/api/groups"
+    endpoint = _get_endpoint(webservice_url, "groups")
     return _get_deadline_info(endpoint, auth, log, "groups")
 
 
@@ -147,7 +280,9 @@ def get_deadline_limit_groups(
         RuntimeError: If deadline webservice_url is unreachable.
 
     """
-    endpoint = f"{webservice_url}/api/limitgroups?NamesOnly=true"
+    endpoint = _get_endpoint(
+        webservice_url, "limitgroups?NamesOnly=true"
+    )
     return _get_deadline_info(endpoint, auth, log, "limitgroups")
 
 def get_deadline_workers(
@@ -170,35 +305,133 @@ def get_deadline_workers(
         RuntimeError: If deadline webservice_url is unreachable.
 
     """
-    endpoint = f"{webservice_url}/api/slaves?NamesOnly=true"
+    endpoint = _get_endpoint(webservice_url, "slaves?NamesOnly=true")
     return _get_deadline_info(endpoint, auth, log, "workers")
 
 
+def get_deadline_info_bulk(
+    webservice_url: str,
+    auth: Optional[Tuple[str, str]] = None,
+    log: Optional[Logger] = None,
+    allow_stale: bool = False,
+) -> Dict[str, List[str]]:
+    """Get pools, groups, limit groups and workers from Deadline API.
+
+    All information is queried in parallel.
+
+    Args:
+        webservice_url (str): Server url.
+        auth (Optional[Tuple[str, str]]): Tuple containing username,
+            password
+        log (Optional[Logger]): Logger to log errors to, if provided.
+        allow_stale (bool): Return expired cached items right away and
+            refresh them in background. Useful for UI where waiting for
+            webservice is worse than showing slightly outdated items.
+
+    Returns:
+        Dict[str, List[str]]: Items by 'DeadlineServerInfo' field names.
+
+    Raises:
+        DeadlineWebserviceError: If deadline webservice_url is unreachable.
+
+    """
+    # Api path and item type by 'DeadlineServerInfo' field names
+    queries = {
+        "pools": ("pools?NamesOnly=true", "pools"),
+        "limit_groups": ("limitgroups?NamesOnly=true", "limitgroups"),
+        "groups": ("groups", "groups"),
+        "machines": ("slaves?NamesOnly=true", "workers"),
+    }
+    with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+        futures = {
+            key: executor.submit(
+                _get_deadline_info,
+                _get_endpoint(webservice_url, api_path),
+                auth,
+                log,
+                item_type,
+                allow_stale,
+            )
+            for key, (api_path, item_type) in queries.items()
+        }
+        return {
+            key: future.result()
+            for key, future in futures.items()
+        }
+
+
 def _get_deadline_info(
     endpoint,
     auth,
     log,
-    item_type
+    item_type,
+    allow_stale=False
 ):
-    from .abstract_submit_deadline import requests_get
-
     if not log:
-        log = Logger.get_logger(__name__)
+        log = _log
+
+    cache_key = (endpoint, auth[0] if auth else None)
+    cached = _INFO_CACHE.get(cache_key)
+    if cached is not None:
+        timestamp, items = cached
+        if time.monotonic() - timestamp < _INFO_CACHE_TTL.get(item_type, 0):
+            return list(items)
+        if allow_stale:
+            _refresh_deadline_info(endpoint, auth, log, item_type)
+            return list(items)
+
+    return _fetch_deadline_info(endpoint, auth, log, item_type)
+
+
+def _refresh_deadline_info(endpoint, auth, log, item_type):
+    """Refresh cached query result in background thread."""
+    cache_key = (endpoint, auth[0] if auth else None)
+    with _INFO_REFRESHING_LOCK:
+        if cache_key in _INFO_REFRESHING:
+            return
+        _INFO_REFRESHING.add(cache_key)
+
+    def _refresh():
+        try:
+            _fetch_deadline_info(endpoint, auth, log, item_type)
+        except Exception:
+            log.debug(f"Failed to refresh {item_type}", exc_info=True)
+        finally:
+            with _INFO_REFRESHING_LOCK:
+                _INFO_REFRESHING.discard(cache_key)
+
+    threading.Thread(target=_refresh, daemon=True).start()
+
 
+def _fetch_deadline_info(endpoint, auth, log, item_type):
+    cache_key = (endpoint, auth[0] if auth else None)
+    cached = _INFO_CACHE.get(cache_key)
     try:
         kwargs = {}
         if auth:
-            kwargs["auth"] = auth
-        response = requests_get(endpoint, **kwargs)
+            kwargs["auth"] = tuple(auth)
+        response = get_session(endpoint).get(
+            endpoint, timeout=DEADLINE_QUERY_TIMEOUT, **kwargs
+        )
     except requests.exceptions.ConnectionError as exc:
         msg = f"Cannot connect to DL web service {endpoint}"
+        if cached is not None:
+            log.warning(f"{msg}, using previously fetched {item_type}")
+            return list(cached[1])
         log.error(msg)
-        raise DeadlineWebserviceError(msg) from exc
+        raise DeadlineWebserviceError(f"{msg} - {exc}") from exc
     if not response.ok:
         log.warning(f"No {item_type} retrieved")
         return []
 
-    return sorted(response.json(), key=lambda value: (value != "none", value))
+    items = response.json()
+    items.sort()
+    # Default 'none' item is always first
+    if "none" in items:
+        items.remove("none")
+        items.insert(0, "none")
+    _INFO_CACHE[cache_key] = (time.monotonic(), items)
+    return list(items)
 
 
 # ------------------------------------------------------------
@@ -214,19 +447,14 @@ def get_instance_job_envs(instance) -> "dict[str, str]":
     # Avoid import from 'ayon_core.pipeline'
     from ayon_core.pipeline.publish import FARM_JOB_ENV_DATA_KEY
 
-    env = {}
-    for job_env in [
-        instance.context.data.get(FARM_JOB_ENV_DATA_KEY, {}),
-        instance.data.get(FARM_JOB_ENV_DATA_KEY, {})
-    ]:
-        if job_env:
-            env.update(job_env)
-
-    # Return the dict sorted just for readability in future logs
-    if env:
-        env = dict(sorted(env.items()))
+    context_env = instance.context.data.get(FARM_JOB_ENV_DATA_KEY)
+    instance_env = instance.data.get(FARM_JOB_ENV_DATA_KEY)
+    if not context_env and not instance_env:
+        return {}
 
-    return env
+    # NOTE Values are not sorted, 'DeadlineKeyValueVar' sorts them
+    #   on serialization
+    return {**(context_env or {}), **(instance_env or {})}
 
 
 class DeadlineKeyValueVar(dict):
@@ -256,10 +484,13 @@ class DeadlineKeyValueVar(dict):
         self._key = key
 
     def serialize(self):
-        # Allow custom location for index in serialized string
+        if not self:
+            return {}
+        # Key always ends with '{}' placeholder for index
+        prefix = self._key[:-2]
         return {
-            self._key.format(idx): f"{key}={value}"
-            for idx, (key, value) in enumerate(sorted(self.items()))
+            f"{prefix}{idx}": f"{key}={self[key]}"
+            for idx, key in enumerate(sorted(self))
         }
 
 
@@ -275,6 +506,11 @@ class DeadlineIndexedVar(dict):
           indices. To do so iterate with `sorted()`
 
     """
+    # Lowest index that might be unused, all lower indices are used
+    _next_index: int = 0
+    # Used values for fast lookups in 'add', 'None' until first needed
+    _values_cache: Optional[set] = None
+
     def __init__(self, key: str):
         super().__init__()
         if "{}" not in key:
@@ -282,20 +518,27 @@ class DeadlineIndexedVar(dict):
         self._key = key
 
     def serialize(self) -> Dict[str, str]:
+        if not self:
+            return {}
+        # Allow custom location for index in serialized string
+        prefix, suffix = self._key.split("{}", 1)
         return {
-            self._key.format(index): value
+            f"{prefix}{index}{suffix}": value
             for index, value in sorted(self.items())
         }
 
     def next_available_index(self):
-        # Add as first unused entry
-        i = 0
-        while i in self.keys():
+        # Add as first unused entry, continue from last known used index
+        i = self._next_index
+        while i in self:
             i += 1
+        self._next_index = i
         return i
 
     def add(self, value: str):
-        if value not in self.values():
+        if self._values_cache is None:
+            self._values_cache = set(self.values())
+        if value not in self._values_cache:
             self.append(value)
 
     def append(self, value: str):
@@ -321,8 +564,93 @@ class DeadlineIndexedVar(dict):
 
         if key < 0:
             raise ValueError(f"Negative index can't be set: {key}")
+
+        if self._values_cache is not None:
+            if key in self:
+                # Replaced value might still be used by other index
+                self._values_cache = None
+            else:
+                self._values_cache.add(value)
         dict.__setitem__(self, key, value)
 
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self._on_items_removed(key)
+
+    def pop(self, key, *args):
+        if key not in self:
+            return dict.pop(self, key, *args)
+        value = dict.pop(self, key)
+        self._on_items_removed(key)
+        return value
+
+    def popitem(self):
+        key, value = dict.popitem(self)
+        self._on_items_removed(key)
+        return key, value
+
+    def clear(self):
+        dict.clear(self)
+        self._on_items_removed(0)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def _on_items_removed(self, index: int):
+        self._values_cache = None
+        if index < self._next_index:
+            self._next_index = index
+
+
+# Placeholder used by Deadline for not set pool or group
+_NONE_VALUE = "none"
+
+# Names of 'DeadlineJobInfo' fields which need conversion of values
+_LIST_FIELD_NAMES = (
+    "JobDependencies",
+    "Whitelist",
+    "Blacklist",
+    "LimitGroups",
+)
+_INDEXED_FIELD_NAMES = (
+    "ExtraInfo",
+    "TaskExtraInfoName",
+    "OutputFilename",
+    "OutputFilenameTile",
+    "OutputDirectory",
+    "AssetDependency",
+)
+_KEY_VALUE_FIELD_NAMES = (
+    "ExtraInfoKeyValue",
+    "EnvironmentKeyValue",
+)
+
+
+def _serialize_value(key: str, value: Any, output: Dict[str, Any]):
+    # Value type can differ from field type when set dynamically,
+    #   e.g. by additional job info
+    if isinstance(value, (DeadlineIndexedVar, DeadlineKeyValueVar)):
+        output.update(value.serialize())
+        return
+    if isinstance(value, list):
+        value = ",".join(value) if value else None
+    if value is not None:
+        output[key] = value
+
+
+def _serialize_list_value(key: str, value: Any, output: Dict[str, Any]):
+    # Empty list is the same as not set value for Deadline
+    if value:
+        output[key] = ",".join(value)
+
+
+def _serialize_var_value(key: str, value: Any, output: Dict[str, Any]):
+    # Most of the vars are empty
+    if value:
+        output.update(value.serialize())
+
 
 def _partial_key_value(key: str):
     return partial(DeadlineKeyValueVar, key)
@@ -332,6 +660,31 @@ def _partial_indexed(key: str):
     return partial(DeadlineIndexedVar, key)
 
 
+def _is_var_field(field_item: "Field") -> bool:
+    var_types = (DeadlineIndexedVar, DeadlineKeyValueVar)
+    field_type = field_item.type
+    if isinstance(field_type, type) and issubclass(field_type, var_types):
+        return True
+    default_factory = field_item.default_factory
+    return (
+        isinstance(default_factory, partial)
+        and default_factory.func in var_types
+    )
+
+
+def _is_list_field(field_item: "Field") -> bool:
+    if field_item.default_factory is list:
+        return True
+    field_type = field_item.type
+    # Unwrap 'Optional[List[str]]'
+    if getattr(field_type, "__origin__", None) is typing.Union:
+        return any(
+            getattr(arg, "__origin__", None) is list
+            for arg in field_type.__args__
+        )
+    return getattr(field_type, "__origin__", None) is list
+
+
 @dataclass
 class DeadlineJobInfo:
     """Mapping of all Deadline JobInfo attributes.
@@ -512,36 +865,21 @@ class DeadlineJobInfo:
     MaintenanceJobEndFrame: int = field(default=0)
 
     def __post_init__(self):
-        for attr_name in (
-            "JobDependencies",
-            "Whitelist",
-            "Blacklist",
-            "LimitGroups",
-        ):
+        for attr_name in _LIST_FIELD_NAMES:
             value = getattr(self, attr_name)
             if value is None:
                 continue
             if not isinstance(value, list):
                 setattr(self, attr_name, value)
 
-        for attr_name in (
-            "ExtraInfo",
-            "TaskExtraInfoName",
-            "OutputFilename",
-            "OutputFilenameTile",
-            "OutputDirectory",
-            "AssetDependency",
-        ):
+        for attr_name in _INDEXED_FIELD_NAMES:
             value = getattr(self, attr_name)
             if value is None:
                 continue
             if not isinstance(value, DeadlineIndexedVar):
                 setattr(self, attr_name, value)
 
-        for attr_name in (
-            "ExtraInfoKeyValue",
-            "EnvironmentKeyValue",
-        ):
+        for attr_name in _KEY_VALUE_FIELD_NAMES:
             value = getattr(self, attr_name)
             if value is None:
                 continue
@@ -553,32 +891,17 @@ class DeadlineJobInfo:
             super().__setattr__(key, value)
             return
 
-        if key in (
-            "JobDependencies",
-            "Whitelist",
-            "Blacklist",
-            "LimitGroups",
-        ):
+        if key in _LIST_FIELD_NAMES:
             if isinstance(value, str):
                 value = value.split(",")
 
-        elif key in (
-            "ExtraInfo",
-            "TaskExtraInfoName",
-            "OutputFilename",
-            "OutputFilenameTile",
-            "OutputDirectory",
-            "AssetDependency",
-        ):
+        elif key in _INDEXED_FIELD_NAMES:
             if not isinstance(value, DeadlineIndexedVar):
                 new_value = DeadlineIndexedVar(key)
                 new_value.update(value)
                 value = new_value
 
-        elif key in (
-            "ExtraInfoKeyValue",
-            "EnvironmentKeyValue",
-        ):
+        elif key in _KEY_VALUE_FIELD_NAMES:
             if not isinstance(value, DeadlineKeyValueVar):
                 new_value = DeadlineKeyValueVar(key)
                 new_value.update(value)
@@ -594,21 +917,74 @@ class DeadlineJobInfo:
 
         """
         output = {}
-        for field_item in fields(self):
-            self._fill_serialize_value(
-                field_item.name, getattr(self, field_item.name), output
-            )
+        for field_name, serializer in self._get_field_serializers():
+            if serializer is None:
+                self._fill_serialize_value(
+                    field_name, getattr(self, field_name), output
+                )
+            else:
+                serializer(field_name, getattr(self, field_name), output)
         return output
 
     def _fill_serialize_value(
         self, key: str, value: Any, output: Dict[str, Any]
-    ) -> Any:
-        if isinstance(value, (DeadlineIndexedVar, DeadlineKeyValueVar)):
-            output.update(value.serialize())
-        elif isinstance(value, list):
-            output[key] = ",".join(value)
-        elif value is not None:
-            output[key] = value
+    ):
+        """Fill serialized value of a field to output.
+
+        Subclasses can override this method for custom serialization,
+        fields are then not serialized by functions from
+        '_get_field_serializer'.
+
+        """
+        _serialize_value(key, value, output)
+
+    @classmethod
+    def _get_field_serializers(
+        cls
+    ) -> "Tuple[Tuple[str, FieldSerializer], ...]":
+        # Resolve serializer of each field only once per class
+        serializers = cls.__dict__.get("_field_serializers")
+        if serializers is None:
+            # Overridden '_fill_serialize_value' is used for all fields
+            #   which are not skipped
+            use_fill_hook = (
+                cls._fill_serialize_value
+                is not DeadlineJobInfo._fill_serialize_value
+            )
+            serializers = []
+            for field_item in fields(cls):
+                serializer = cls._get_field_serializer(field_item)
+                if serializer is None:
+                    continue
+                if use_fill_hook:
+                    serializer = None
+                serializers.append((field_item.name, serializer))
+            serializers = tuple(serializers)
+            cls._field_serializers = serializers
+        return serializers
+
+    @classmethod
+    def _get_field_serializer(
+        cls, field_item: "Field"
+    ) -> "Optional[FieldSerializer]":
+        """Serializer function for a field.
+
+        Serializer is chosen by declared type or default factory of the
+        field, so fields added by subclasses are handled too.
+
+        Args:
+            field_item (Field): Dataclass field.
+
+        Returns:
+            Optional[FieldSerializer]: Function filling serialized value
+                of the field to output, or 'None' to skip the field.
+
+        """
+        if _is_var_field(field_item):
+            return _serialize_var_value
+        if _is_list_field(field_item):
+            return _serialize_list_value
+        return _serialize_value
 
 
 @dataclass
@@ -651,28 +1027,22 @@ class PublishDeadlineJobInfo(DeadlineJobInfo):
 
         Any instance `job_env` vars will override the context `job_env` vars.
         """
-        for key, value in get_instance_job_envs(instance).items():
-            self.EnvironmentKeyValue[key] = value
+        self.EnvironmentKeyValue.update(get_instance_job_envs(instance))
 
-    def _fill_serialize_value(
-        self, key: str, value: Any, output: Dict[str, Any]
-    ):
-        if key not in (
+    @classmethod
+    def _get_field_serializer(cls, field_item: "Field"):
+        # AYON custom fields are not sent to Deadline
+        if field_item.name in (
             "use_published",
             "use_asset_dependencies",
             "use_workfile_dependency",
         ):
-            super()._fill_serialize_value(key, value, output)
+            return None
+        return super()._get_field_serializer(field_item)
 
     @staticmethod
-    def _sanitize(value) -> "Union[str, List[str], None]":
-        if isinstance(value, str):
-            if value == "none":
-                return None
-            return value
-        if isinstance(value, list):
-            filtered = []
-            for val in value:
-                if val and val != "none":
-                    filtered.append(val)
-            return filtered
+    def _sanitize(value: Any) -> Any:
+        """Convert Deadline's 'none' placeholder to 'None'."""
+        if value == _NONE_VALUE:
+            return None
+        return value
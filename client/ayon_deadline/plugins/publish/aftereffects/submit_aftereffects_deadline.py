@@ -53,12 +53,11 @@ class AfterEffectsSubmitDeadline(
 
         render_path = self._instance.data["expectedFiles"][0]
 
-        file_name, frame = list(collect_frames([render_path]).items())[0]
+        frame = next(iter(collect_frames([render_path]).values()))
         if frame:
             # replace frame ('000001') with Deadline's required '[#######]'
             # expects filename in format project_folder_product_version.FRAME.ext
-            render_dir = os.path.dirname(render_path)
-            file_name = os.path.basename(render_path)
+            render_dir, file_name = os.path.split(render_path)
             hashed = '[{}]'.format(len(frame) * "#")
             file_name = file_name.replace(frame, hashed)
             render_path = os.path.join(render_dir, file_name)
@@ -2,7 +2,8 @@
 """Submitting render job to Deadline."""
 
 import os
-from dataclasses import dataclass, field, asdict
+
+import pyblish.api
 
 from ayon_core.pipeline.publish import AYONPyblishPluginMixin
 from ayon_core.pipeline.farm.tools import iter_expected_files
@@ -10,47 +11,43 @@ from ayon_core.pipeline.farm.tools import iter_expected_files
 from ayon_deadline import abstract_submit_deadline
 
 
-@dataclass
-class BlenderPluginInfo:
-    SceneFile: str = field(default=None)   # Input
-    Version: str = field(default=None)  # Mandatory for Deadline
-    SaveFile: bool = field(default=True)
-
-
 class BlenderSubmitDeadline(abstract_submit_deadline.AbstractSubmitDeadline,
                             AYONPyblishPluginMixin):
     label = "Submit Render to Deadline"
     hosts = ["blender"]
-    families = ["render"]  # TODO this should be farm specific as render.farm
+    # Only farm instances have 'deadline' family, added by 'CollectJobInfo'
+    families = ["render", "deadline"]
+    match = pyblish.api.Subset
     settings_category = "deadline"
 
+    # Blender version is same for whole process
+    _blender_version = None
+
     def get_job_info(self, job_info=None):
         instance = self._instance
         job_info.Plugin = instance.data.get("blenderRenderPlugin", "Blender")
 
         # Deadline requires integers in frame range
-        frames = "{start}-{end}x{step}".format(
-            start=int(instance.data["frameStartHandle"]),
-            end=int(instance.data["frameEndHandle"]),
-            step=int(instance.data["byFrameStep"]),
-        )
-        job_info.Frames = frames
+        frame_start = int(instance.data["frameStartHandle"])
+        frame_end = int(instance.data["frameEndHandle"])
+        frame_step = int(instance.data["byFrameStep"])
+        job_info.Frames = f"{frame_start}-{frame_end}x{frame_step}"
 
         return job_info
 
     def get_plugin_info(self):
-        # Not all hosts can import this module.
-        import bpy
+        cls = self.__class__
+        if cls._blender_version is None:
+            # Not all hosts can import this module.
+            import bpy
 
-        plugin_info = BlenderPluginInfo(
-            SceneFile=self.scene_path,
-            Version=bpy.app.version_string,
-            SaveFile=True,
-        )
+            cls._blender_version = bpy.app.version_string
 
-        plugin_payload = asdict(plugin_info)
-
-        return plugin_payload
+        return {
+            "SceneFile": self.scene_path,  # Input
+            "Version": cls._blender_version,  # Mandatory for Deadline
+            "SaveFile": True,
+        }
 
     def process_submission(self, auth=None):
         instance = self._instance
@@ -59,7 +56,11 @@ class BlenderSubmitDeadline(abstract_submit_deadline.AbstractSubmitDeadline,
         if not expected_files:
             raise RuntimeError("No Render Elements found!")
 
-        first_file = next(iter_expected_files(expected_files))
+        # Render layers can be without files
+        first_file = next(iter_expected_files(expected_files), None)
+        if first_file is None:
+            raise RuntimeError("No Render Elements found!")
+
         output_dir = os.path.dirname(first_file)
         instance.data["outputDir"] = output_dir
         instance.data["toBeRenderedOn"] = "deadline"
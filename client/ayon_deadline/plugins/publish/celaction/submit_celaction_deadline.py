@@ -1,20 +1,12 @@
 import os
 import re
 import pyblish.api
-from dataclasses import dataclass, field, asdict
 
-from ayon_deadline import abstract_submit_deadline
+from ayon_core.pipeline.publish import PublishError
 
+from ayon_deadline import abstract_submit_deadline
 
-@dataclass
-class CelactionPluginInfo:
-    SceneFile: str = field(default=None)
-    OutputFilePath: str = field(default=None)
-    Output: str = field(default=None)
-    StartupDirectory: str = field(default=None)
-    Arguments: str = field(default=None)
-    ProjectPath: str = field(default=None)
-    AWSAssetFile0: str = field(default=None)
+_PADDING_RE = re.compile(r"(%0)(\d)(d)[._]")
 
 
 class CelactionSubmitDeadline(abstract_submit_deadline.AbstractSubmitDeadline):
@@ -43,7 +35,6 @@ class CelactionSubmitDeadline(abstract_submit_deadline.AbstractSubmitDeadline):
         return job_info
 
     def get_plugin_info(self):
-        plugin_info = CelactionPluginInfo()
         instance = self._instance
 
         render_path = instance.data["path"]
@@ -52,36 +43,41 @@ class CelactionSubmitDeadline(abstract_submit_deadline.AbstractSubmitDeadline):
         self._expected_files(instance, render_path)
 
         script_path = self.scene_path
-        plugin_info.SceneFile = script_path
-        plugin_info.ProjectPath = script_path
-        plugin_info.OutputFilePath = render_dir.replace("\\", "/")
-        plugin_info.StartupDirectory = ""
-
         resolution_width = instance.data["resolutionWidth"]
         resolution_height = instance.data["resolutionHeight"]
-        search_results = re.search(r"(%0)(\d)(d)[._]", render_path).groups()
+        match = _PADDING_RE.search(render_path)
+        if match is None:
+            raise PublishError(
+                f"Render path '{render_path}' does not contain frame padding"
+                " in expected format (e.g. '%04d.')."
+            )
+        search_results = match.groups()
         split_patern = "".join(search_results)
         padding_number = int(search_results[1])
 
-        args = [
-            f"<QUOTE>{script_path}<QUOTE>",
-            "-a",
-            "-16",
-            "-s <STARTFRAME>",
-            "-e <ENDFRAME>",
-            f"-d <QUOTE>{render_dir}<QUOTE>",
-            f"-x {resolution_width}",
-            f"-y {resolution_height}",
-            f"-r <QUOTE>{render_path.replace(split_patern, '')}<QUOTE>",
-            f"-= AbsoluteFrameNumber=on -= PadDigits={padding_number}",
-            "-= ClearAttachment=on",
-        ]
-        plugin_info.Arguments = " ".join(args)
+        render_file_path = render_path.replace(split_patern, "")
+        arguments = (
+            f"<QUOTE>{script_path}<QUOTE>"
+            " -a -16 -s <STARTFRAME> -e <ENDFRAME>"
+            f" -d <QUOTE>{render_dir}<QUOTE>"
+            f" -x {resolution_width} -y {resolution_height}"
+            f" -r <QUOTE>{render_file_path}<QUOTE>"
+            f" -= AbsoluteFrameNumber=on -= PadDigits={padding_number}"
+            " -= ClearAttachment=on"
+        )
 
         # adding 2d render specific family for version identification in Loader
         instance.data["families"] = ["render2d"]
 
-        return asdict(plugin_info)
+        return {
+            "SceneFile": script_path,
+            "OutputFilePath": render_dir.replace("\\", "/"),
+            "Output": None,
+            "StartupDirectory": "",
+            "Arguments": arguments,
+            "ProjectPath": script_path,
+            "AWSAssetFile0": None,
+        }
 
     def _expected_files(self, instance, filepath):
         """ Create expected files in instance data
@@ -89,8 +85,7 @@ class CelactionSubmitDeadline(abstract_submit_deadline.AbstractSubmitDeadline):
         if not instance.data.get("expectedFiles"):
             instance.data["expectedFiles"] = []
 
-        dirpath = os.path.dirname(filepath)
-        filename = os.path.basename(filepath)
+        dirpath, filename = os.path.split(filepath)
 
         if "#" in filename:
             pparts = filename.split("#")
@@ -101,7 +96,11 @@ class CelactionSubmitDeadline(abstract_submit_deadline.AbstractSubmitDeadline):
             instance.data["expectedFiles"].append(filepath)
             return
 
-        for i in range(self._frame_start, (self._frame_end + 1)):
-            instance.data["expectedFiles"].append(
-                os.path.join(dirpath, (filename % i)).replace("\\", "/")
-            )
+        frame_start = int(round(instance.data["frameStart"]))
+        frame_end = int(round(instance.data["frameEnd"]))
+        base = dirpath.replace("\\", "/").rstrip("/") + "/" if dirpath else ""
+        filename = filename.replace("\\", "/")
+        instance.data["expectedFiles"].extend([
+            base + (filename % frame)
+            for frame in range(frame_start, frame_end + 1)
+        ])
@@ -1,26 +1,9 @@
-from dataclasses import dataclass, field, asdict
-
 import pyblish.api
 
 from ayon_core.pipeline.publish import AYONPyblishPluginMixin
 from ayon_deadline import abstract_submit_deadline
 
 
-@dataclass
-class FusionPluginInfo:
-    FlowFile: str = field(default=None)   # Input
-    Version: str = field(default=None)    # Mandatory for Deadline
-
-    # Render in high quality
-    HighQuality: bool = field(default=True)
-    # Whether saver output should be checked after rendering
-    # is complete
-    CheckOutput: bool = field(default=True)
-    # Proxy: higher numbers smaller images for faster test renders
-    # 1 = no proxy quality
-    Proxy: int = field(default=1)
-
-
 class FusionSubmitDeadline(abstract_submit_deadline.AbstractSubmitDeadline,
                            AYONPyblishPluginMixin):
     """Submit current Comp to Deadline
@@ -32,19 +15,19 @@ class FusionSubmitDeadline(abstract_submit_deadline.AbstractSubmitDeadline,
     label = "Submit Fusion to Deadline"
     order = pyblish.api.IntegratorOrder
     hosts = ["fusion"]
-    families = ["render"]
+    # Only farm instances have 'deadline' family, added by 'CollectJobInfo'
+    families = ["render", "deadline"]
+    match = pyblish.api.Subset
     targets = ["local"]
     settings_category = "deadline"
 
     # presets
     plugin = None
 
-    def process(self, instance):
-        if not instance.data.get("farm"):
-            self.log.debug("Render on farm is disabled. "
-                           "Skipping deadline submission.")
-            return
+    # Context data key marking that the comp was already submitted
+    _has_run_key = "__hasRunFusionSubmitDeadline"
 
+    def process(self, instance):
         # TODO: Avoid this hack and instead use a proper way to submit
         #  each render per instance individually
         # TODO: Also, we should support submitting a job per group of instances
@@ -56,26 +39,21 @@ class FusionSubmitDeadline(abstract_submit_deadline.AbstractSubmitDeadline,
         # comp. This is a hack to avoid submitting multiple jobs for each
         # saver separately which would be much slower.
         context = instance.context
-        key = "__hasRun{}".format(self.__class__.__name__)
-        if context.data.get(key, False):
+        if context.data.get(self._has_run_key, False):
             return
         else:
-            context.data[key] = True
-
-        # Collect all saver instances in context that are to be rendered
-        saver_instances = []
-        context = instance.context
-        for inst in context:
-            if inst.data["productType"] != "render":
-                # Allow only saver family instances
-                continue
-
-            if not inst.data.get("publish", True):
-                # Skip inactive instances
-                continue
-
+            context.data[self._has_run_key] = True
+
+        # Collect all active saver instances in context that are to be
+        # rendered
+        saver_instances = [
+            inst
+            for inst in context
+            if inst.data.get("productType") == "render"
+            and inst.data.get("publish", True)
+        ]
+        for inst in saver_instances:
             self.log.debug(inst.data["name"])
-            saver_instances.append(inst)
 
         if not saver_instances:
             raise RuntimeError("No instances found for Deadline submission")
@@ -109,15 +87,22 @@ class FusionSubmitDeadline(abstract_submit_deadline.AbstractSubmitDeadline,
             if saver_instance is instance:
                 continue
 
-            self._append_job_output_paths(instance, job_info)
+            self._append_job_output_paths(saver_instance, job_info)
 
         return job_info
 
     def get_plugin_info(self):
         instance = self._instance
-        plugin_info = FusionPluginInfo(
-            FlowFile=self.scene_path,
-            Version=str(instance.data["app_version"]),
-        )
-        plugin_payload: dict = asdict(plugin_info)
-        return plugin_payload
+        return {
+            "FlowFile": self.scene_path,  # Input
+            # Mandatory for Deadline
+            "Version": str(instance.data["app_version"]),
+            # Render in high quality
+            "HighQuality": True,
+            # Whether saver output should be checked after rendering
+            # is complete
+            "CheckOutput": True,
+            # Proxy: higher numbers smaller images for faster test renders
+            # 1 = no proxy quality
+            "Proxy": 1,
+        }
@@ -1,4 +1,5 @@
 import os
+import logging
 
 import pyblish.api
 
@@ -11,7 +12,7 @@ class CollectDeadlineJobEnvVars(pyblish.api.ContextPlugin):
     label = "Deadline Farm Environment Variables"
     targets = ["local"]
 
-    ENV_KEYS = [
+    ENV_KEYS = (
         # applications addon
         "AYON_APP_NAME",
 
@@ -30,18 +31,24 @@ class CollectDeadlineJobEnvVars(pyblish.api.ContextPlugin):
 
         # Not sure how this is usefull for farm, scared to remove
         "PYBLISHPLUGINPATH",
-    ]
+    )
 
     def process(self, context):
         env = context.data.setdefault(FARM_JOB_ENV_DATA_KEY, {})
-        for key in self.ENV_KEYS:
-            # Skip already set keys
-            if key in env:
-                continue
-            value = os.getenv(key)
-            if value:
+        environ = os.environ
+        # Skip already set keys
+        new_env = {
+            key: environ[key]
+            for key in self.ENV_KEYS
+            if key not in env and environ.get(key)
+        }
+        if not new_env:
+            return
+
+        if self.log.isEnabledFor(logging.DEBUG):
+            for key, value in new_env.items():
                 self.log.debug(f"Setting job env: {key}: {value}")
-                env[key] = value
+        env.update(new_env)
 
 
 class CollectAYONServerToFarmJob(CollectDeadlineJobEnvVars):
@@ -51,6 +58,6 @@ class CollectAYONServerToFarmJob(CollectDeadlineJobEnvVars):
     # Defined via settings
     enabled = False
 
-    ENV_KEYS = [
-        "AYON_SERVER_URL"
-    ]
+    ENV_KEYS = (
+        "AYON_SERVER_URL",
+    )
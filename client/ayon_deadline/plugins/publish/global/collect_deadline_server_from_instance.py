@@ -21,7 +21,7 @@ from typing import Optional, Tuple
 import pyblish.api
 from ayon_core.pipeline.publish import KnownPublishError, PublishError
 
-from ayon_deadline.lib import FARM_FAMILIES
+from ayon_deadline.lib import FARM_FAMILIES, normalize_webservice_url
 
 
 class CollectDeadlineServerFromInstance(pyblish.api.InstancePlugin):
@@ -66,6 +66,7 @@ class CollectDeadlineServerFromInstance(pyblish.api.InstancePlugin):
             deadline_url = context_deadline_info["defaultUrl"]
             server_name = context_deadline_info["defaultServerName"]
 
+        deadline_url = normalize_webservice_url(deadline_url)
         if not server_name:
             server_name = self._find_server_name(instance, deadline_url)
 
@@ -75,7 +76,6 @@ class CollectDeadlineServerFromInstance(pyblish.api.InstancePlugin):
                 f" existing deadline servers configured in Studio Settings."
             )
 
-        deadline_url = deadline_url.strip().rstrip("/")
         deadline_info["url"] = deadline_url
         # TODO prefer server name over url
         deadline_info["serverName"] = server_name
@@ -93,21 +93,26 @@ class CollectDeadlineServerFromInstance(pyblish.api.InstancePlugin):
 
         Args:
             instance (pyblish.api.Instance): Instance object.
-            deadline_url (str): Deadline Webservice URL.
+            deadline_url (str): Normalized Deadline Webservice URL.
 
         Returns:
             Optional[str]: Deadline server name.
 
         """
-        deadline_url = deadline_url.strip().rstrip("/")
+        context = instance.context
+        server_names_by_url = context.data.get("deadlineServerNamesByUrl")
+        if server_names_by_url is None:
+            deadline_settings = context.data["project_settings"]["deadline"]
+            server_names_by_url = {}
+            for server_info in deadline_settings["deadline_servers_info"]:
+                # First server with the url wins
+                server_names_by_url.setdefault(
+                    normalize_webservice_url(server_info["value"]),
+                    server_info["name"]
+                )
+            context.data["deadlineServerNamesByUrl"] = server_names_by_url
 
-        deadline_settings = (
-            instance.context.data["project_settings"]["deadline"]
-        )
-        for server_info in deadline_settings["deadline_servers_info"]:
-            if server_info["value"].strip().rstrip("/") == deadline_url:
-                return server_info["name"]
-        return None
+        return server_names_by_url.get(deadline_url)
 
     def _collect_maya_deadline_server(
         self, render_instance: pyblish.api.Instance
@@ -150,10 +155,14 @@ class CollectDeadlineServerFromInstance(pyblish.api.InstancePlugin):
                 asString=True
             )
 
-        default_servers = {
-            url_item["name"]: url_item["value"]
-            for url_item in deadline_settings["deadline_servers_info"]
-        }
+        context = render_instance.context
+        default_servers = context.data.get("deadlineServerUrlsByName")
+        if default_servers is None:
+            default_servers = {
+                url_item["name"]: url_item["value"]
+                for url_item in deadline_settings["deadline_servers_info"]
+            }
+            context.data["deadlineServerUrlsByName"] = default_servers
         project_servers = deadline_settings["deadline_servers"]
         if not project_servers:
             self.log.debug("Not project servers found. Using default servers.")
@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 """Collect default Deadline server."""
 import pyblish.api
+from ayon_core.pipeline.publish import PublishError
+
+from ayon_deadline.lib import normalize_webservice_url
 
 
 class CollectDefaultDeadlineServer(pyblish.api.ContextPlugin):
@@ -33,14 +36,17 @@ class CollectDefaultDeadlineServer(pyblish.api.ContextPlugin):
             dl_server_info = deadline_addon.deadline_servers_info.get(
                 deadline_server_name)
 
-        if dl_server_info:
-            deadline_url = dl_server_info["value"]
-        else:
-            key = next(k for k in deadline_addon.deadline_servers_info.keys())
-            default_dl_server_info = deadline_addon.deadline_servers_info[key]
-            deadline_url = default_dl_server_info["value"]
-
+        if not dl_server_info:
+            if not deadline_addon.deadline_servers_info:
+                raise PublishError(
+                    "No Deadline servers are configured in Studio Settings."
+                )
+            dl_server_info = next(
+                iter(deadline_addon.deadline_servers_info.values())
+            )
         context.data["deadline"] = {
-            "defaultUrl": deadline_url.strip().rstrip("/"),
-            "defaultServerName": deadline_server_name,
+            "defaultUrl": normalize_webservice_url(dl_server_info["value"]),
+            # Name of server which was actually used so instances don't have
+            #   to look it up by url
+            "defaultServerName": dl_server_info["name"],
         }
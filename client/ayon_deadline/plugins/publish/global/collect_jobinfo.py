@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
-import json
+import copy
+import functools
 
 import pyblish.api
 from ayon_core.lib import (
@@ -11,15 +12,43 @@ from ayon_core.lib import (
 )
 from ayon_core.pipeline.publish import AYONPyblishPluginMixin
 from ayon_core.lib.profiles_filtering import filter_profiles
-from ayon_core.addon import AddonsManager
 
 from ayon_deadline.lib import (
     FARM_FAMILIES,
     PublishDeadlineJobInfo,
     DeadlineWebserviceError,
+    json_loads,
 )
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_json_cached(value):
+    """Parse JSON string from settings, shared for all instances.
+
+    Returned data is cached and must not be modified.
+    """
+    return json_loads(value)
+
+
+def _parse_json(value):
+    """Parse JSON string from settings.
+
+    Returns deep copy of cached data, nested values are stored on
+    instances and must not be shared between them.
+    """
+    return copy.deepcopy(_parse_json_cached(value))
+
+
+def _get_enum_items(values):
+    """Convert Deadline names to enum items, value is used as label.
+
+    Placeholder item is returned if there are no values.
+    """
+    if not values:
+        return [{"value": None, "label": "< none >"}]
+    return [{"value": value, "label": value} for value in values]
+
+
 class CollectJobInfo(pyblish.api.InstancePlugin, AYONPyblishPluginMixin):
     """Collect variables that belong to Deadline's JobInfo.
 
@@ -37,10 +66,19 @@ class CollectJobInfo(pyblish.api.InstancePlugin, AYONPyblishPluginMixin):
     targets = ["local"]
 
     profiles = []
+    # Filtered profiles by (host name, task type, task name), reset with
+    #   'profiles' in 'apply_settings'
+    _profiles_cache = {}
     pool_enum_values = []
     group_enum_values = []
     limit_group_enum_values = []
     machines_enum_values = []
+    # Project settings used to lazily query enum values from Deadline
+    _enum_values_settings = None
+    # Values of enum items for fast validation of profile defaults
+    _group_values = frozenset()
+    _limit_group_values = frozenset()
+    _machine_values = frozenset()
 
     def process(self, instance):
         if not instance.data.get("farm"):
@@ -59,7 +97,7 @@ class CollectJobInfo(pyblish.api.InstancePlugin, AYONPyblishPluginMixin):
         # pass through explicitly key and values for PluginInfo
         plugin_info_data = None
         if attr_values["additional_plugin_info"]:
-            plugin_info_data = json.loads(
+            plugin_info_data = _parse_json(
                 attr_values["additional_plugin_info"]
             )
 
@@ -77,28 +115,31 @@ class CollectJobInfo(pyblish.api.InstancePlugin, AYONPyblishPluginMixin):
 
         """
         instance_families = instance.data.setdefault("families", [])
-        all_families = set(instance_families)
-        all_families.add(instance.data["family"])
+        existing_families = set(instance_families)
 
+        new_families = []
         # Add deadline family
-        if "deadline" not in instance_families:
-            instance_families.append("deadline")
+        if "deadline" not in existing_families:
+            new_families.append("deadline")
 
         # 'publish.hou' has different submit job plugin
         # TODO find out if we need separate submit publish job plugin
-        if "publish.hou" in all_families:
-            return
+        if (
+            "publish.hou" not in existing_families
+            and instance.data["family"] != "publish.hou"
+            and "deadline.submit.publish.job" not in existing_families
+        ):
+            # Add submit publish job family
+            new_families.append("deadline.submit.publish.job")
 
-        # Add submit publish job family
-        if "deadline.submit.publish.job" not in instance_families:
-            instance_families.append("deadline.submit.publish.job")
+        instance_families.extend(new_families)
 
     def _handle_additional_jobinfo(self,attr_values, job_info):
         """Adds not explicitly implemented fields by values from Settings."""
         additional_job_info = attr_values["additional_job_info"]
         if not additional_job_info:
             return
-        for key, value in json.loads(additional_job_info).items():
+        for key, value in _parse_json(additional_job_info).items():
             setattr(job_info, key, value)
 
     def _handle_machine_list(self, attr_values, job_info):
@@ -115,48 +156,65 @@ class CollectJobInfo(pyblish.api.InstancePlugin, AYONPyblishPluginMixin):
         profiles = settings["publish"][cls.__name__]["profiles"]
 
         cls.profiles = profiles or []
+        cls._profiles_cache = {}
+
+        # Deadline webservice is queried only when attribute definitions
+        #   are needed, not when plugins are discovered
+        cls._enum_values_settings = project_settings
+        cls.pool_enum_values = []
+        cls.group_enum_values = []
+        cls.limit_group_enum_values = []
+        cls.machines_enum_values = []
+        cls._group_values = frozenset()
+        cls._limit_group_values = frozenset()
+        cls._machine_values = frozenset()
+
+    @classmethod
+    def _load_enum_values(cls):
+        """Query Deadline server for enum values if not queried yet."""
+        project_settings = cls._enum_values_settings
+        if project_settings is None:
+            return
+        cls._enum_values_settings = None
+
+        # Imported here as it is needed only when enum values are queried
+        from ayon_core.addon import AddonsManager
 
         addons_manager = AddonsManager(project_settings)
         deadline_addon = addons_manager["deadline"]
-        deadline_server_name = settings["deadline_server"]
+        deadline_server_name = project_settings["deadline"]["deadline_server"]
         pools = []
         groups = []
         limit_groups = []
         machines = []
         try:
+            # Expired items are fine for enum values, they are refreshed
+            #   in background for next call
             server_info = deadline_addon.get_server_info_by_name(
-                deadline_server_name
+                deadline_server_name, allow_stale=True
             )
-            pools = [
-                {"value": pool, "label": pool}
-                for pool in server_info.pools
-            ]
+            pools = server_info.pools
             # Groups always includes the default 'none' group
-            groups = [
-                {"value": group, "label": group}
-                for group in server_info.groups
-            ]
-            limit_groups = [
-                {"value": limit_group, "label": limit_group}
-                for limit_group in server_info.limit_groups
-            ]
-            machines = [
-                {"value": machine, "label": machine}
-                for machine in server_info.machines
-            ]
+            groups = server_info.groups
+            limit_groups = server_info.limit_groups
+            machines = server_info.machines
         except DeadlineWebserviceError:
             cls.log.warning(f"Unable to connect to {deadline_server_name}")
 
-        for items in [
-            pools, groups, limit_groups, machines
-        ]:
-            if not items:
-                items.append({"value": None, "label": "< none >"})
+        pools = _get_enum_items(pools)
+        groups = _get_enum_items(groups)
+        limit_groups = _get_enum_items(limit_groups)
+        machines = _get_enum_items(machines)
 
         cls.pool_enum_values = pools
         cls.group_enum_values = groups
         cls.limit_group_enum_values = limit_groups
         cls.machines_enum_values = machines
+        cls._group_values = frozenset(item["value"] for item in groups)
+        cls._limit_group_values = frozenset(
+            item["value"] for item in limit_groups
+        )
+        cls._machine_values = frozenset(item["value"] for item in machines)
 
     @classmethod
     def get_attr_defs_for_instance(cls, create_context, instance):
@@ -171,6 +229,19 @@ class CollectJobInfo(pyblish.api.InstancePlugin, AYONPyblishPluginMixin):
         """
         if not cls.instance_matches_plugin_families(instance):
             return []
+        return cls._get_attr_defs_for_farm_instance(create_context, instance)
+
+    @classmethod
+    def _get_attr_defs_for_farm_instance(cls, create_context, instance):
+        """Get artist overridable attr defs for instance matching families.
+
+        Same as 'get_attr_defs_for_instance' without the families check,
+        for callers which already did it.
+
+        """
+        # Nothing can be overridden, skip task entity lookup
+        if not cls.profiles:
+            return []
 
         host_name = create_context.host_name
 
@@ -182,15 +253,7 @@ class CollectJobInfo(pyblish.api.InstancePlugin, AYONPyblishPluginMixin):
         if task_entity:
             task_name = task_entity["name"]
             task_type = task_entity["taskType"]
-        profile = filter_profiles(
-            cls.profiles,
-            {
-                "host_names": host_name,
-                "task_types": task_type,
-                "task_names": task_name,
-                # "product_type": product_type
-            }
-        )
+        profile = cls._filter_profile(host_name, task_type, task_name)
         if not profile:
             return []
         overrides = set(profile["overrides"])
@@ -222,112 +285,110 @@ class CollectJobInfo(pyblish.api.InstancePlugin, AYONPyblishPluginMixin):
     @classmethod
     def _get_artist_overrides(cls, overrides, profile):
         """Provide list of all possible Defs that could be filled by artist"""
+        cls._load_enum_values()
+
         # should be matching to extract_jobinfo_overrides_enum
         default_values = {}
         for key in overrides:
             default_value = profile[key]
             if key == "machine_limit":
-                available_values = {
-                    item["value"]
-                    for item in cls.machines_enum_values
-                }
                 default_value = [
                     value
                     for value in default_value
-                    if value in available_values
+                    if value in cls._machine_values
                 ]
             elif key == "limit_groups":
-                available_values = {
-                    item["value"]
-                    for item in cls.limit_group_enum_values
-                }
                 default_value = [
                     value
                     for value in default_value
-                    if value in available_values
+                    if value in cls._limit_group_values
                 ]
             elif key == "group":
-                available_values = [
-                    item["value"]
-                    for item in cls.group_enum_values
-                ]
-                if not available_values:
+                if not cls.group_enum_values:
                     default_value = None
-                elif default_value not in available_values:
-                    default_value = available_values[0]
+                elif default_value not in cls._group_values:
+                    default_value = cls.group_enum_values[0]["value"]
             default_values[key] = default_value
 
-        attr_defs = [
-            NumberDef(
+        # Create only definitions overridable by artist
+        attr_defs = []
+        if "chunk_size" in overrides:
+            attr_defs.append(NumberDef(
                 "chunk_size",
                 label="Frames Per Task",
                 default=default_values.get("chunk_size"),
                 decimals=0,
                 minimum=1,
                 maximum=1000
-            ),
-            NumberDef(
+            ))
+        if "priority" in overrides:
+            attr_defs.append(NumberDef(
                 "priority",
                 label="Priority",
                 default=default_values.get("priority"),
                 decimals=0
-            ),
-            TextDef(
+            ))
+        if "department" in overrides:
+            attr_defs.append(TextDef(
                 "department",
                 label="Department",
                 default=default_values.get("department")
-            ),
-            EnumDef(
+            ))
+        if "group" in overrides:
+            attr_defs.append(EnumDef(
                 "group",
                 label="Group",
                 default=default_values.get("group"),
                 items=cls.group_enum_values,
-            ),
-            EnumDef(
+            ))
+        if "limit_groups" in overrides:
+            attr_defs.append(EnumDef(
                 "limit_groups",
                 label="Limit Groups",
                 multiselection=True,
                 default=default_values.get("limit_groups"),
                 items=cls.limit_group_enum_values,
-            ),
-            EnumDef(
+            ))
+        if "primary_pool" in overrides:
+            attr_defs.append(EnumDef(
                 "primary_pool",
                 label="Primary pool",
                 default=default_values.get("primary_pool", "none"),
                 items=cls.pool_enum_values,
-            ),
-            EnumDef(
+            ))
+        if "secondary_pool" in overrides:
+            attr_defs.append(EnumDef(
                 "secondary_pool",
                 label="Secondary pool",
                 default=default_values.get("secondary_pool", "none"),
                 items=cls.pool_enum_values,
-            ),
-            EnumDef(
+            ))
+        if "machine_list" in overrides:
+            attr_defs.append(EnumDef(
                 "machine_list",
                 label="Machine list",
                 multiselection=True,
                 default=default_values.get("machine_list"),
                 items=cls.machines_enum_values,
-            ),
-            BoolDef(
+            ))
+        if "machine_list_deny" in overrides:
+            attr_defs.append(BoolDef(
                 "machine_list_deny",
                 label="Machine List is a Deny",
                 default=default_values.get("machine_list_deny")
-            ),
-            TextDef(
+            ))
+        if "job_delay" in overrides:
+            attr_defs.append(TextDef(
                 "job_delay",
                 label="Delay job",
                 default=default_values.get("job_delay"),
-                tooltip="Delay job by specified timecode. Format: dd:hh:mm:ss",
+                tooltip=(
+                    "Delay job by specified timecode. Format: dd:hh:mm:ss"
+                ),
                 placeholder="00:00:00:00"
-            )
-        ]
+            ))
 
-        return [
-            attr_def
-            for attr_def in attr_defs
-            if attr_def.key in overrides
-        ]
+        return attr_defs
 
     @classmethod
     def register_create_context_callbacks(cls, create_context):
@@ -347,7 +408,7 @@ class CollectJobInfo(pyblish.api.InstancePlugin, AYONPyblishPluginMixin):
             if not cls.instance_matches_plugin_families(instance):
                 continue
 
-            new_attrs = cls.get_attr_defs_for_instance(
+            new_attrs = cls._get_attr_defs_for_farm_instance(
                 event["create_context"], instance
             )
             instance.set_publish_plugin_attr_defs(cls.__name__, new_attrs)
@@ -370,13 +431,34 @@ class CollectJobInfo(pyblish.api.InstancePlugin, AYONPyblishPluginMixin):
             task_name = task_entity["name"]
             task_type = task_entity["taskType"]
 
-        profile = filter_profiles(
-            self.profiles,
-            {
-                "host_names": host_name,
-                "task_types": task_type,
-                "task_names": task_name,
-                # "product_type": product_type
-            }
-        )
-        return profile or {}
+        profile = self._filter_profile(host_name, task_type, task_name)
+        # Copy as the result is updated by caller
+        return dict(profile) if profile else {}
+
+    @classmethod
+    def _filter_profile(cls, host_name, task_type, task_name):
+        """Find profile matching the context, cached per context.
+
+        Args:
+            host_name (str): Host name.
+            task_type (Optional[str]): Task type.
+            task_name (Optional[str]): Task name.
+
+        Returns:
+            Optional[dict]: Matching profile, must not be modified.
+        """
+        if not cls.profiles:
+            return None
+
+        key = (host_name, task_type, task_name)
+        if key not in cls._profiles_cache:
+            cls._profiles_cache[key] = filter_profiles(
+                cls.profiles,
+                {
+                    "host_names": host_name,
+                    "task_types": task_type,
+                    "task_names": task_name,
+                    # "product_type": product_type
+                }
+            )
+        return cls._profiles_cache[key]
@@ -14,7 +14,7 @@ import pyblish.api
 
 from ayon_api import get_server_api_connection
 
-from ayon_deadline.lib import FARM_FAMILIES
+from ayon_deadline.lib import FARM_FAMILIES, normalize_webservice_url
 
 
 class CollectDeadlineUserCredentials(pyblish.api.InstancePlugin):
@@ -65,7 +65,9 @@ class CollectDeadlineUserCredentials(pyblish.api.InstancePlugin):
                 " instance['deadline']['serverName']."
             )
             for deadline_info in dealine_info_by_server_name.values():
-                dl_settings_url = deadline_info["value"].strip().rstrip("/")
+                dl_settings_url = normalize_webservice_url(
+                    deadline_info["value"]
+                )
                 if dl_settings_url == collected_deadline_url:
                     deadline_server_name = deadline_info["name"]
                     break